@@ -1,17 +1,111 @@
 import json
+import logging
 import os
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+# orjson is a compiled wheel and is only present when it has been packaged with
+# the function, so fall back to the standard library when it is missing.
+# _dumps returns str, which is what API Gateway expects for the body.
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+# The Lambda runtime attaches its handler to the root logger
+logger = logging.getLogger()
+_log_level = os.environ.get('LOG_LEVEL', 'INFO').upper()
+logger.setLevel(_log_level if isinstance(logging.getLevelName(_log_level), int) else logging.INFO)
+
+# Keep the connection to Bedrock alive between warm invocations. The read
+# timeout stays under the 30s function timeout (and API Gateway's 29s limit)
+# so a stalled call surfaces as an error response instead of a killed Lambda.
+_CFG = Config(
+    tcp_keepalive=True,
+    connect_timeout=2,
+    read_timeout=25,
+    retries={'total_max_attempts': 2, 'mode': 'standard'},
+    max_pool_connections=4
+)
+
 # Initialize Bedrock client
 bedrock_runtime = boto3.client(
     service_name='bedrock-runtime',
-    region_name=os.environ.get('AWS_REGION', 'us-east-1')
+    region_name=os.environ.get('AWS_REGION', 'us-east-1'),
+    config=_CFG
 )
 
+# Resolve the bound operation once so it is part of the initialized state
+# that warm invocations (and any SnapStart snapshot) reuse
+_converse = bedrock_runtime.converse
+
 # Model ID - can be overridden via environment variable
 MODEL_ID = os.environ.get('BEDROCK_MODEL_ID', 'anthropic.claude-3-haiku-20240307-v1:0')
 
+# Latency-optimized inference: 'optimized' (default) or 'standard'.
+# Only a handful of models support it, so it is skipped for everything else.
+LATENCY_MODE = os.environ.get('BEDROCK_LATENCY_MODE', 'optimized').lower()
+LATENCY_OPTIMIZED_MODELS = {
+    'anthropic.claude-3-5-haiku-20241022-v1:0',
+    'meta.llama3-1-70b-instruct-v1:0',
+    'meta.llama3-1-405b-instruct-v1:0',
+    'amazon.nova-pro-v1:0'
+}
+
+# Strip the cross-region inference profile prefix before the lookup. This
+# covers the common geographies only; unlisted prefixes use standard mode.
+_PROFILE_PREFIXES = ('us.', 'us-gov.', 'eu.', 'apac.')
+_base_model_id = MODEL_ID.split('.', 1)[1] if MODEL_ID.startswith(_PROFILE_PREFIXES) else MODEL_ID
+
+# The SDK bundled with the Lambda runtime may predate performanceConfig
+# (botocore 1.35.73), in which case sending it fails parameter validation
+_SUPPORTS_PERFORMANCE_CONFIG = (
+    'performanceConfig'
+    in bedrock_runtime.meta.service_model.operation_model('Converse').input_shape.members
+)
+
+if (LATENCY_MODE == 'optimized'
+        and _base_model_id in LATENCY_OPTIMIZED_MODELS
+        and _SUPPORTS_PERFORMANCE_CONFIG):
+    CONVERSE_KWARGS = {'performanceConfig': {'latency': 'optimized'}}
+else:
+    CONVERSE_KWARGS = {}
+
+# Response headers shared by every API Gateway response
+CORS_HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*',  # Configure this based on your domain
+    'Access-Control-Allow-Headers': 'Content-Type',
+    'Access-Control-Allow-Methods': 'POST, OPTIONS'
+}
+
+# Shell copied by build_response; only statusCode and body change per call
+_RESPONSE_TEMPLATE = {
+    'statusCode': 200,
+    'headers': CORS_HEADERS,
+    'body': None
+}
+
+# Pre-serialized response for requests without a query; returned as a copy
+_ERR_400 = {
+    'statusCode': 400,
+    'headers': CORS_HEADERS,
+    'body': _dumps({'error': 'Query is required'})
+}
+
+# Inference settings for the Converse API
+INFERENCE_CONFIG = {
+    "maxTokens": 1000,
+    "temperature": 0.7
+}
+
 
 def lambda_handler(event, context):
     """
@@ -26,77 +120,78 @@ def lambda_handler(event, context):
     {
         "query": "Your question here"
     }
+
+    Warm-up pings ({"warmer": true}) return immediately without calling Bedrock.
     """
 
-    print(f"Received event: {json.dumps(event)}")
+    logger.debug("Received event: %s", event)
 
     try:
-        # Parse the incoming request
-        if 'body' in event:
-            # API Gateway format
-            body = json.loads(event['body']) if isinstance(event['body'], str) else event['body']
-        else:
+        # Scheduled warm-up ping from EventBridge - skip Bedrock entirely
+        if event.get('warmer') is True or event.get('source') == 'aws.events':
+            return {'statusCode': 200, 'body': 'warm'}
+
+        # Parse the incoming request. API Gateway always sends the body as a
+        # JSON string, so that case runs without any type checks.
+        try:
+            body = _loads(event['body'])
+        except KeyError:
             # Direct invocation format
             body = event
+        except (TypeError, ValueError):
+            # Direct invocation with an already-decoded or null body;
+            # malformed JSON strings still fail the request
+            if isinstance(event['body'], (str, bytes)):
+                raise
+            body = event['body'] or event
 
         # Extract the query
         query = body.get('query', '')
 
         if not query:
-            return {
-                'statusCode': 400,
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*',  # Configure this based on your domain
-                    'Access-Control-Allow-Headers': 'Content-Type',
-                    'Access-Control-Allow-Methods': 'POST, OPTIONS'
-                },
-                'body': json.dumps({
-                    'error': 'Query is required'
-                })
-            }
-
-        print(f"Processing query: {query}")
+            return _ERR_400.copy()
+
+        logger.info("Processing query: %s", query)
 
         # Call Bedrock
         response = invoke_bedrock(query)
 
         # Return success response
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*',  # Configure this based on your domain
-                'Access-Control-Allow-Headers': 'Content-Type',
-                'Access-Control-Allow-Methods': 'POST, OPTIONS'
-            },
-            'body': json.dumps({
-                'query': query,
-                'response': response,
-                'model': MODEL_ID
-            })
-        }
+        return build_response(200, {
+            'query': query,
+            'response': response,
+            'model': MODEL_ID
+        })
 
     except Exception as e:
-        print(f"Error processing request: {str(e)}")
-        return {
-            'statusCode': 500,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': 'Content-Type',
-                'Access-Control-Allow-Methods': 'POST, OPTIONS'
-            },
-            'body': json.dumps({
-                'error': f'Internal server error: {str(e)}'
-            })
-        }
+        logger.error("Error processing request: %s", e)
+        return build_response(500, {
+            'error': f'Internal server error: {str(e)}'
+        })
+
+
+def build_response(status_code, payload):
+    """
+    Build an API Gateway proxy response.
+
+    Args:
+        status_code (int): HTTP status code
+        payload (dict): Response body, serialized to JSON in a single pass
+
+    Returns:
+        dict: The API Gateway response envelope
+    """
+
+    response = _RESPONSE_TEMPLATE.copy()
+    response['statusCode'] = status_code
+    response['body'] = _dumps(payload)
+    return response
 
 
 def invoke_bedrock(query):
     """
     Invoke Amazon Bedrock with the given query.
-    Supports both Anthropic models and other models using Converse API.
+    Uses the Converse API, which works for Anthropic and non-Anthropic models alike.
 
     Args:
         query (str): The user's query
@@ -106,64 +201,33 @@ def invoke_bedrock(query):
     """
 
     try:
-        # Check if it's an Anthropic model
-        if 'anthropic' in MODEL_ID.lower():
-            # Use Anthropic-specific API
-            request_body = {
-                "anthropic_version": "bedrock-2023-05-31",
-                "max_tokens": 1000,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": query
-                    }
-                ]
-            }
-
-            response = bedrock_runtime.invoke_model(
-                modelId=MODEL_ID,
-                body=json.dumps(request_body)
-            )
-
-            response_body = json.loads(response['body'].read())
-
-            # Extract text from Anthropic response
-            if 'content' in response_body and len(response_body['content']) > 0:
-                return response_body['content'][0]['text']
-            else:
-                return "No response generated"
-
-        else:
-            # Use Converse API for non-Anthropic models (Amazon Nova, etc.)
-            response = bedrock_runtime.converse(
-                modelId=MODEL_ID,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "text": query
-                            }
-                        ]
-                    }
-                ],
-                inferenceConfig={
-                    "maxTokens": 1000,
-                    "temperature": 0.7
+        response = _converse(
+            modelId=MODEL_ID,
+            messages=[
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "text": query
+                        }
+                    ]
                 }
-            )
+            ],
+            inferenceConfig=INFERENCE_CONFIG,
+            **CONVERSE_KWARGS
+        )
 
-            # Extract text from Converse API response
-            if 'output' in response and 'message' in response['output']:
-                return response['output']['message']['content'][0]['text']
-            else:
-                return "No response generated"
+        # Extract text from Converse API response
+        if 'output' in response and 'message' in response['output']:
+            return response['output']['message']['content'][0]['text']
+        else:
+            return "No response generated"
 
     except ClientError as e:
         error_code = e.response['Error']['Code']
         error_message = e.response['Error']['Message']
 
-        print(f"Bedrock error: {error_code} - {error_message}")
+        logger.error("Bedrock error: %s - %s", error_code, error_message)
 
         if error_code == 'AccessDeniedException':
             raise Exception(
@@ -177,12 +241,14 @@ def invoke_bedrock(query):
             raise Exception(f"Bedrock error: {error_message}")
 
     except Exception as e:
-        print(f"Unexpected error calling Bedrock: {str(e)}")
+        logger.error("Unexpected error calling Bedrock: %s", e)
         raise
 
 
 # For local testing
 if __name__ == "__main__":
+    logging.basicConfig()
+
     # Test event
     test_event = {
         "query": "What is Amazon Web Services?"
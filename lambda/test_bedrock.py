@@ -8,14 +8,41 @@ Usage:
     python lambda/test_bedrock.py
 """
 
+import io
 import json
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 # Configuration
 REGION = 'us-east-1'  # Change if needed
 
+# Models are tested concurrently; each test is a single Bedrock round-trip
+MAX_WORKERS = 8
+
+# Bedrock Runtime client shared by all tests (boto3 clients are thread-safe)
+_RUNTIME = boto3.client(
+    service_name='bedrock-runtime',
+    region_name=REGION,
+    config=Config(tcp_keepalive=True, max_pool_connections=16)
+)
+
+# Request body for Anthropic models, serialized once to UTF-8 bytes
+ANTHROPIC_REQUEST_BODY = json.dumps({
+    "anthropic_version": "bedrock-2023-05-31",
+    "max_tokens": 100,
+    "messages": [
+        {
+            "role": "user",
+            "content": "Say 'Hello from Anthropic model!' in a single sentence."
+        }
+    ]
+}).encode()
+
 # Anthropic models
 ANTHROPIC_MODELS = [
     'anthropic.claude-3-5-sonnet-20240620-v1:0',
@@ -34,7 +61,7 @@ NON_ANTHROPIC_MODELS = [
 ]
 
 
-def test_anthropic_model(model_id: str = 'anthropic.claude-3-haiku-20240307-v1:0') -> bool:
+def test_anthropic_model(model_id: str = 'anthropic.claude-3-haiku-20240307-v1:0', client=_RUNTIME) -> bool:
     """Test Anthropic models using their specific API format."""
 
     print(f"\n{'='*60}")
@@ -45,30 +72,12 @@ def test_anthropic_model(model_id: str = 'anthropic.claude-3-haiku-20240307-v1:0
     print("-" * 60)
 
     try:
-        # Create Bedrock Runtime client
-        bedrock_runtime = boto3.client(
-            service_name='bedrock-runtime',
-            region_name=REGION
-        )
-
-        # Prepare request body for Anthropic models
-        request_body = {
-            "anthropic_version": "bedrock-2023-05-31",
-            "max_tokens": 100,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": "Say 'Hello from Anthropic model!' in a single sentence."
-                }
-            ]
-        }
-
         print("Sending test request to Bedrock...")
 
         # Invoke the model
-        response = bedrock_runtime.invoke_model(
+        response = client.invoke_model(
             modelId=model_id,
-            body=json.dumps(request_body)
+            body=ANTHROPIC_REQUEST_BODY
         )
 
         # Parse response
@@ -105,7 +114,7 @@ def test_anthropic_model(model_id: str = 'anthropic.claude-3-haiku-20240307-v1:0
         return False
 
 
-def test_non_anthropic_model(model_id: str) -> bool:
+def test_non_anthropic_model(model_id: str, client=_RUNTIME) -> bool:
     """Test non-Anthropic models using Converse API."""
 
     print(f"\n{'='*60}")
@@ -116,16 +125,10 @@ def test_non_anthropic_model(model_id: str) -> bool:
     print("-" * 60)
 
     try:
-        # Create Bedrock Runtime client
-        bedrock_runtime = boto3.client(
-            service_name='bedrock-runtime',
-            region_name=REGION
-        )
-
         print("Sending test request using Converse API...")
 
         # Use Converse API (works with most models)
-        response = bedrock_runtime.converse(
+        response = client.converse(
             modelId=model_id,
             messages=[
                 {
@@ -174,6 +177,59 @@ def test_non_anthropic_model(model_id: str) -> bool:
         return False
 
 
+class _ThreadBufferedStdout:
+    """Send print() output from a worker thread to that thread's buffer, if it has one."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer or self._stream).write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+    def capture(self, test_fn, model_id: str):
+        """Run test_fn(model_id) and return its result along with everything it printed."""
+
+        self._local.buffer = io.StringIO()
+        try:
+            return test_fn(model_id), self._local.buffer.getvalue()
+        finally:
+            self._local.buffer = None
+
+
+def run_concurrently(test_fn, model_ids: List[str]) -> List[str]:
+    """Run test_fn for each model in parallel and return the working models in list order.
+
+    Each model's output is buffered and printed as one block when it finishes,
+    so output from different models does not interleave.
+    """
+
+    stdout = sys.stdout
+    buffered = _ThreadBufferedStdout(stdout)
+    sys.stdout = buffered
+    passed = set()
+
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(buffered.capture, test_fn, model_id): model_id
+                for model_id in model_ids
+            }
+            for future in as_completed(futures):
+                success, output = future.result()
+                stdout.write(output)
+                if success:
+                    passed.add(futures[future])
+    finally:
+        sys.stdout = stdout
+
+    return [model_id for model_id in model_ids if model_id in passed]
+
+
 def list_available_models():
     """List available foundation models in Bedrock."""
 
@@ -194,7 +250,8 @@ def list_available_models():
         non_anthropic = []
 
         for model in response['modelSummaries']:
-            if 'anthropic' in model['modelId'].lower():
+            # Model IDs are "<provider>.<model>", so match on the provider prefix
+            if model['modelId'].startswith('anthropic.'):
                 anthropic.append(model)
             else:
                 non_anthropic.append(model)
@@ -251,10 +308,7 @@ if __name__ == "__main__":
         print("TESTING ANTHROPIC MODELS")
         print("="*60)
 
-        for model_id in ANTHROPIC_MODELS:
-            success = test_anthropic_model(model_id)
-            if success:
-                anthropic_success.append(model_id)
+        anthropic_success = run_concurrently(test_anthropic_model, ANTHROPIC_MODELS)
 
     # Test Non-Anthropic models
     if choice in ["2", "3"]:
@@ -262,10 +316,7 @@ if __name__ == "__main__":
         print("TESTING NON-ANTHROPIC MODELS")
         print("="*60)
 
-        for model_id in NON_ANTHROPIC_MODELS:
-            success = test_non_anthropic_model(model_id)
-            if success:
-                non_anthropic_success.append(model_id)
+        non_anthropic_success = run_concurrently(test_non_anthropic_model, NON_ANTHROPIC_MODELS)
 
     # List models
     if choice == "4":
@@ -49,6 +49,35 @@ resource "aws_lambda_permission" "api_gateway" {
   source_arn    = "${aws_api_gateway_rest_api.bedrock_api.execution_arn}/*/*"
 }
 
+# Scheduled warm-up ping to keep an execution environment warm (optional)
+resource "aws_cloudwatch_event_rule" "lambda_warmer" {
+  count               = var.lambda_warmer_enabled ? 1 : 0
+  name                = "${var.project_name}-lambda-warmer"
+  description         = "Keeps the Bedrock query Lambda warm"
+  schedule_expression = "rate(5 minutes)"
+
+  tags = {
+    Name = "${var.project_name}-lambda-warmer"
+  }
+}
+
+resource "aws_cloudwatch_event_target" "lambda_warmer" {
+  count = var.lambda_warmer_enabled ? 1 : 0
+  rule  = aws_cloudwatch_event_rule.lambda_warmer[0].name
+  arn   = aws_lambda_function.bedrock_query.arn
+  input = jsonencode({ warmer = true })
+}
+
+# Lambda permission for the EventBridge warmer
+resource "aws_lambda_permission" "lambda_warmer" {
+  count         = var.lambda_warmer_enabled ? 1 : 0
+  statement_id  = "AllowEventBridgeWarmerInvoke"
+  action        = "lambda:InvokeFunction"
+  function_name = aws_lambda_function.bedrock_query.function_name
+  principal     = "events.amazonaws.com"
+  source_arn    = aws_cloudwatch_event_rule.lambda_warmer[0].arn
+}
+
 # Output Lambda function details
 output "lambda_function_name" {
   description = "Name of the Lambda function"
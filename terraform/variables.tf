@@ -36,6 +36,12 @@ variable "lambda_memory" {
   default     = 512
 }
 
+variable "lambda_warmer_enabled" {
+  description = "Ping the Lambda every 5 minutes via EventBridge to avoid cold starts"
+  type        = bool
+  default     = false
+}
+
 variable "domain_name" {
   description = "Custom domain name (from GoDaddy)"
   type        = string